@@ -1,13 +1,26 @@
 # chatbot.py
 
 import json
+import asyncio
 import logging
 import inspect
 from typing import Any, Callable, List, Dict
-from ollama import chat, ChatResponse
+from ollama import AsyncClient, ChatResponse, Message
 from tools import SCRAPING_TOOLS
 from tool_executor import ToolExecutor
 
+try:
+    import orjson
+
+    def _to_json(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            # Integers wider than 64 bits, e.g. large IDs in JSON-LD
+            return json.dumps(obj)
+except ImportError:
+    _to_json = json.dumps
+
 logging.basicConfig(
     level=logging.INFO,
     format="[%(asctime)s] %(levelname)s: %(message)s",
@@ -17,60 +30,130 @@ logging.basicConfig(
 # Tool names that require an output directory
 TOOLS_NEED_OUTPUT_DIR = {"download_file", "download_files_by_type", "scrape", "focused_scrape_files_by_terms"}
 
+SUMMARY_PROMPT = (
+    "Summarize the following conversation in a few sentences. "
+    "Keep any facts, URLs, file names and decisions needed to continue it.\n\n"
+)
+
 class ChatBot:
-    def __init__(self, model: str, tools: List[Callable[..., Any]]):
+    def __init__(self, model: str, tools: List[Callable[..., Any]], max_turns: int = 16, summarize: bool = False):
         self.model = model
         self.executor = ToolExecutor(tools)
         self.messages: List[Dict[str, Any]] = []
+        self._client = AsyncClient()
+        self._tools_payload = list(self.executor.tools.values())
+        self._output_dir_tools = frozenset(
+            name for name in self.executor.tools if 'output_dir' in self.executor.get_signature(name)
+        )
+        self._max_turns = max_turns
+        self._summarize = summarize
+        self._summary_message: Dict[str, Any] | None = None
+
+    async def _summarize_messages(self, messages: List[Any]) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages if m["content"])
+        response: ChatResponse = await self._client.chat(
+            model=self.model, messages=[{"role": "user", "content": SUMMARY_PROMPT + transcript}]
+        )
+        return response.message.content
+
+    async def _trim_history(self, keep_system: bool = True) -> None:
+        """
+        Keep the conversation within max_turns user turns.
+
+        Once the limit is exceeded the history is cut back to half of it in one go, so the retained
+        prefix stays stable between trims and the server can keep reusing its cached context. Cuts
+        always land on a user message so tool results stay with the call that produced them.
+
+        Args:
+            keep_system (bool): Pin a leading system message so it is never trimmed.
+        """
+        pinned: List[Any] = []
+        history = self.messages
+        if keep_system and history and history[0]["role"] == "system" and history[0] is not self._summary_message:
+            pinned, history = history[:1], history[1:]
+
+        user_turns = [i for i, m in enumerate(history) if m["role"] == "user"]
+        if len(user_turns) <= self._max_turns:
+            return
+
+        cut = user_turns[-max(self._max_turns // 2, 1)]
+        dropped, history = history[:cut], history[cut:]
+
+        if self._summarize:
+            try:
+                summary = await self._summarize_messages(dropped)
+                self._summary_message = {"role": "system", "content": f"Earlier conversation: {summary}"}
+                history = [self._summary_message] + history
+            except Exception as e:
+                logging.warning(f"[HISTORY] Summarizing dropped turns failed: {e}")
+
+        logging.info(f"[HISTORY] Dropped {len(dropped)} messages")
+        self.messages = pinned + history
+
+    async def _run_tool_call(self, call: Message.ToolCall, progress_callback=None, output_dir='downloads') -> Dict[str, Any]:
+        fn_name = call.function.name
+        args = dict(call.function.arguments)
 
-    def send(self, user_input: str, progress_callback=None, output_dir='downloads') -> str | None:
+        if progress_callback:
+            param_str = ', '.join(f"{k}={v!r}" for k, v in args.items())
+            progress_callback(f"Calling tool: `{fn_name}({param_str})`")
+            logging.info(f"[TOOL CALL] {fn_name}({param_str})")
+
+        if fn_name in self._output_dir_tools:
+            if 'output_dir' not in args or args['output_dir'] == 'downloads':
+                args['output_dir'] = output_dir
+
+        result = await self.executor.aexecute(fn_name, args)
+
+        return {
+            "role": "tool",
+            "name": fn_name,
+            "content": _to_json(result)
+        }
+
+    async def send(self, user_input: str, progress_callback=None, output_dir='downloads', keep_system=True) -> str | None:
         logging.info(f"[RECEIVED USER] {user_input}")
         self.messages.append({"role": "user", "content": user_input})
 
         try:
-            response: ChatResponse = chat(
-                model=self.model, messages=self.messages, tools=list(self.executor.tools.values())
+            response: ChatResponse = await self._client.chat(
+                model=self.model, messages=self.messages, tools=self._tools_payload
             )
 
             if response.message.tool_calls:
-                call = response.message.tool_calls[0]
-                fn_name = call.function.name
-                args = dict(call.function.arguments)
-
-                if progress_callback:
-                    param_str = ', '.join(f"{k}={v!r}" for k, v in args.items())
-                    progress_callback(f"Calling tool: `{fn_name}({param_str})`")
-                    logging.info(f"[TOOL CALL] {fn_name}({param_str})")
-
-                if 'output_dir' in self.executor.get_signature(fn_name):
-                    if 'output_dir' not in args or args['output_dir'] == 'downloads':
-                        args['output_dir'] = output_dir
-
-                result = self.executor.execute(fn_name, args)
+                tool_messages = await asyncio.gather(*(
+                    self._run_tool_call(call, progress_callback, output_dir)
+                    for call in response.message.tool_calls
+                ))
 
-                self.messages.append(response.message)  # assistant's tool call
-                self.messages.append({
-                    "role": "tool",
-                    "name": fn_name,
-                    "content": json.dumps(result)
-                })
+                self.messages.append(response.message)  # assistant's tool calls
+                self.messages.extend(tool_messages)
 
-                response = chat(model=self.model, messages=self.messages, tools=list(self.executor.tools.values()))
+                response = await self._client.chat(
+                    model=self.model, messages=self.messages, tools=self._tools_payload
+                )
 
             reply = response.message.content
             self.messages.append({"role": "assistant", "content": reply})
             logging.info(f"[BOT REPLY] {reply}")
+            await self._trim_history(keep_system)
             return reply
 
         except Exception as e:
             logging.exception(f"[ERROR] Exception in ChatBot.send: {e}")
             raise
-if __name__ == "__main__":
+
+
+async def main():
     bot = ChatBot(model="webscraper", tools=SCRAPING_TOOLS)
     print("Chatbot ready! Type your questions (or 'quit' to exit).")
     while True:
-        user_in = input("You: ")
+        user_in = await asyncio.to_thread(input, "You: ")
         if user_in.strip().lower() == "quit":
             break
-        bot_reply = bot.send(user_in)
+        bot_reply = await bot.send(user_in)
         print("Bot:", bot_reply)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,29 +1,96 @@
 #scraper.py
 import os
+import re
 import csv
 import json
-from typing import List, Dict, Optional, Any
-from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass
+import hashlib
+from typing import List, Dict, Optional, Any, Set, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, ParseResult
+from pathlib import Path
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
+from functools import lru_cache
 import asyncio
+import time
 import aiofiles 
 import httpx
-from bs4 import BeautifulSoup
-from bs4.element import Comment
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Comment, NavigableString
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, indent=2, default=asdict).encode("utf-8")
+
+
+# orjson reads integer literals wider than 64 bits as floats (and refuses to write such ints),
+# so documents that may hold one go through the stdlib instead
+WIDE_INT_RE = re.compile(rb"\d{20,}")
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            return _stdlib_json_dumps(obj)
+
+    def _json_loads(data: bytes) -> Any:
+        if WIDE_INT_RE.search(data):
+            return json.loads(data)
+        return orjson.loads(data)
+except ImportError:
+    _json_dumps = _stdlib_json_dumps
+    _json_loads = json.loads
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 SEARCH_TERMS = ['price', 'cost', 'patients', 'transparency', 'estimates']
-FILE_EXTENSIONS = ['.pdf', '.xlsx', 'csv']
+FILE_EXTENSIONS = ['.pdf', '.xlsx', '.csv']
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+EXPORT_BUFFER_SIZE = 1024 * 1024
+CSV_FIELDS = ["url", "title", "main_text_snippet", "num_links", "num_headings", "num_json_ld"]
+HTTP_URL_RE = re.compile(r"https?://[^/\s?#]+", re.IGNORECASE)
+USER_AGENT = "python-llm-toolkit/0.1.0"
+# httpx advertises gzip/deflate (and br when brotli is installed) itself and decodes bodies transparently
+PAGE_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+    "Accept-Language": "en"
+}
+# Built once and set on the shared client, so requests inherit it rather than passing their own
+REQUEST_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+FAILED_URL_TTL = 15 * 60  # seconds before a failed URL may be retried
+HTML_PARSER = "lxml"
+LINK_STRAINER = SoupStrainer("a", href=True)
+HEADING_TAGS = frozenset(f"h{i}" for i in range(1, 7))
+HIDDEN_PARENTS = frozenset({'style', 'script', 'head', 'meta', '[document]', 'noscript', 'title'})
 
 
 def is_visible(element):
-    if element.parent.name in ['style', 'script', 'head', 'meta', '[document]']:
-        return False
-    if isinstance(element, Comment):
-        return False
-    return True
+    parent = element.parent
+    return parent is not None and parent.name not in HIDDEN_PARENTS and not isinstance(element, Comment)
+
+
+def iter_visible_text(soup):
+    """Yield the stripped, non-empty visible strings of a parsed page in document order."""
+    for element in soup.descendants:
+        if isinstance(element, NavigableString) and is_visible(element):
+            text = element.strip()
+            if text:
+                yield text
 
 
-@dataclass
+def page_title(soup):
+    """Return the stripped <title> of a parsed page, or "" when it has none."""
+    return soup.title.get_text(strip=True) if soup.title else ""
+
+
+@dataclass(slots=True)
 class PageSnapshot:
     url: str
     title: str
@@ -33,14 +100,11 @@ class PageSnapshot:
     links: List[Dict[str, str]]
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "url": self.url,
-            "title": self.title,
-            "headings": self.headings,
-            "main_text_snippet": self.main_text_snippet,
-            "json_ld": self.json_ld,
-            "links": self.links
-        }
+        return dict(zip(_SNAPSHOT_FIELDS, _get_snapshot_fields(self)))
+
+
+_SNAPSHOT_FIELDS = tuple(f.name for f in fields(PageSnapshot))
+_get_snapshot_fields = attrgetter(*_SNAPSHOT_FIELDS)
 
 
 class WebScraper:
@@ -51,30 +115,243 @@ class WebScraper:
                  output_dir: Optional[str] = "downloads",
                  urls: Optional[List[str]] = None):
 
-        self.search_terms = search_terms if search_terms is not None else SEARCH_TERMS
+        # An empty term would match every page in the substring fallback but never in the automaton
+        self.search_terms = [term for term in (search_terms if search_terms is not None else SEARCH_TERMS) if term]
         self.file_types = file_types if file_types is not None else FILE_EXTENSIONS
+        self._file_type_suffixes = tuple(
+            ft.lower() if ft.startswith('.') else '.' + ft.lower() for ft in self.file_types
+        )
+        self._file_type_suffix_len = max(map(len, self._file_type_suffixes), default=0)
         self.max_depth = max_depth
         self.output_dir = output_dir
         self.visited_sites = set()
         self.files_downloaded = []
         self.found_files = []
         self.urls = urls if urls else []
+        self._client: Optional[httpx.AsyncClient] = None
+        self._soup_cache: Dict[str, Tuple[BeautifulSoup, str]] = {}
+        self._failed: Dict[str, float] = {}
+        self._download_owners: Dict[str, str] = {}
+        self._search_terms_lc = [term.lower() for term in self.search_terms]
+        self._keyword_automaton = self._build_keyword_automaton(self._search_terms_lc)
 
         os.makedirs(self.output_dir, exist_ok=True)
 
     @staticmethod
+    def _build_keyword_automaton(terms: List[str]):
+        """Build an Aho-Corasick automaton matching all (lowercased) terms in one pass, if pyahocorasick is installed."""
+        if ahocorasick is None or not terms:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return automaton
+
+    def _match_keywords(self, text: str) -> List[str]:
+        """Return the search terms found in already-lowercased text, in search_terms order."""
+        terms = zip(self.search_terms, self._search_terms_lc)
+        if self._keyword_automaton is not None:
+            found: Set[str] = set()
+            wanted = len(self._keyword_automaton)
+            for _, match in self._keyword_automaton.iter(text):
+                found.add(match)
+                if len(found) == wanted:
+                    # Every term has been seen; skip scanning the rest of the page
+                    break
+            return [keyword for keyword, term in terms if term in found]
+        return [keyword for keyword, term in terms if term in text]
+
+    def _page_keywords(self, title: str, text: str) -> List[str]:
+        """Return the search terms found in a page's title or visible text."""
+        return self._match_keywords(f"{title} {text}".lower())
+
+    @staticmethod
+    def _canonicalize(url: str) -> str:
+        """
+        Normalize a URL so trivially different spellings of one page share a key.
+
+        Drops the fragment and utm_* tracking parameters, lowercases scheme and host,
+        removes default ports and gives an empty path a trailing slash.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        userinfo, at, host = parts.netloc.rpartition("@")
+        host = host.lower()
+        default_port = DEFAULT_PORTS.get(scheme)
+        if default_port and host.endswith(default_port):
+            host = host[:-len(default_port)]
+        netloc = userinfo + at + host
+        query = parts.query
+        if "utm_" in query:
+            # Filter the raw pieces; re-encoding would rewrite the parameters that are kept
+            query = "&".join(piece for piece in query.split("&") if not piece.startswith("utm_"))
+        return urlunsplit((scheme, netloc, parts.path or "/", query, ""))
+
+    def _recently_failed(self, url: str) -> bool:
+        failed_at = self._failed.get(url)
+        if failed_at is None:
+            return False
+        if time.monotonic() - failed_at > FAILED_URL_TTL:
+            del self._failed[url]
+            return False
+        return True
+
+    @staticmethod
+    @lru_cache(maxsize=100_000)
     def is_valid_http_url(url: str) -> bool:
-        parsed = urlparse(url)
-        return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
+        return HTTP_URL_RE.match(url) is not None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared async client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=REQUEST_TIMEOUT,
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=100, keepalive_expiry=30),
+                headers=PAGE_HEADERS,
+                follow_redirects=True
+            )
+        return self._client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared pooled async client, for callers driving the per-URL extractors themselves."""
+        return self._get_client()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and drop the parsed pages cached during this run."""
+        self._soup_cache.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "WebScraper":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _get_soup(self, client: httpx.AsyncClient, url: str,
+                        parse_only: Optional[SoupStrainer] = None) -> Tuple[BeautifulSoup, str]:
+        """
+        Return the parsed page and the URL it was served from, fetching and parsing it only
+        if it is not cached yet.
+
+        The served URL differs from url after a redirect and is the base for relative links.
+        With parse_only, an uncached page is parsed partially and not cached, since other
+        extractors need the full tree. Cached pages are served until aclose() ends the run
+        (crawl also drops each page once it is analyzed), so reopen the scraper to refetch.
+        """
+        cached = self._soup_cache.get(url)
+        if cached is None:
+            response = await client.get(url)
+            response.raise_for_status()
+            base_url = str(response.url)
+            # Hand the raw bytes to the parser so the body is decoded once; a charset from
+            # the Content-Type header still wins over meta/BOM sniffing
+            encoding = response.charset_encoding
+            if parse_only is not None:
+                return BeautifulSoup(response.content, HTML_PARSER, parse_only=parse_only,
+                                     from_encoding=encoding), base_url
+            cached = self._soup_cache[url] = (
+                BeautifulSoup(response.content, HTML_PARSER, from_encoding=encoding), base_url
+            )
+        return cached
+
+    @staticmethod
+    def _scan_soup(soup: BeautifulSoup, url: str, base_url: str) -> Dict[str, Any]:
+        """
+        Collect everything the extractors need from a parsed page in a single tree walk.
+
+        Args:
+            soup (BeautifulSoup): Parsed page.
+            url (str): Requested page URL.
+            base_url (str): URL the page was served from, used to resolve relative links.
+
+        Returns:
+            Dict[str, Any]: title, description, headings, main_text, json_ld and links.
+        """
+        description = None
+        headings: Dict[str, List[str]] = {f"h{i}": [] for i in range(1, 7)}
+        texts: List[str] = []
+        json_ld: List[Dict[str, Any]] = []
+        links: List[Dict[str, str]] = []
+
+        for el in soup.descendants:
+            if isinstance(el, NavigableString):
+                if is_visible(el):
+                    text = el.strip()
+                    if text:
+                        texts.append(text)
+                continue
+
+            name = el.name
+            if name in HEADING_TAGS:
+                headings[name].append(el.get_text(strip=True))
+            elif name == "a":
+                if el.has_attr("href"):
+                    try:
+                        href = urljoin(base_url, el["href"])
+                    except ValueError:
+                        # Malformed href such as a placeholder host; skip just this link
+                        continue
+                    links.append({"text": el.get_text(strip=True), "href": href})
+            elif name == "script":
+                if el.get("type") == "application/ld+json" and el.string:
+                    try:
+                        parsed = _json_loads(el.string.encode())
+                        json_ld.extend(parsed if isinstance(parsed, list) else [parsed])
+                    except Exception:
+                        continue
+            elif name == "meta" and description is None and el.get("name") == "description":
+                description = el["content"].strip() if el.has_attr("content") else ""
+
+        return {
+            "url": url,
+            "title": page_title(soup),
+            "description": description or "",
+            "headings": headings,
+            "main_text": " ".join(texts),
+            "json_ld": json_ld,
+            "links": links
+        }
+
+    @staticmethod
+    def _snapshot_from_page(page: Dict[str, Any]) -> PageSnapshot:
+        joined_text = page["main_text"]
+        snippet = joined_text[:1000] + "..." if len(joined_text) > 1000 else joined_text
+        return PageSnapshot(
+            url=page["url"],
+            title=page["title"],
+            headings=page["headings"],
+            main_text_snippet=snippet,
+            json_ld=page["json_ld"],
+            links=page["links"]
+        )
+
+    def _analyze(self, soup: BeautifulSoup, url: str, base_url: str) -> Tuple[List[str], PageSnapshot, List[str]]:
+        """
+        Produce everything crawl needs for a page from one traversal of its tree.
+
+        Returns:
+            Tuple[List[str], PageSnapshot, List[str]]: Matched search terms (from title and visible text),
+            the page snapshot, and the absolute http(s) links found on the page.
+        """
+        page = self._scan_soup(soup, url, base_url)
+        keyword_hits = self._page_keywords(page["title"], page["main_text"])
+        links = [link["href"] for link in page["links"] if self.is_valid_http_url(link["href"])]
+        return keyword_hits, self._snapshot_from_page(page), links
 
     async def fetch_links_from_url(self, client: httpx.AsyncClient, url: str) -> List[str]:
         links = []
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup, base_url = await self._get_soup(client, url, parse_only=LINK_STRAINER)
             for a_tag in soup.find_all("a", href=True):
-                full_url = urljoin(url, a_tag["href"])
+                try:
+                    full_url = urljoin(base_url, a_tag["href"])
+                except ValueError:
+                    continue
                 if self.is_valid_http_url(full_url):
                     links.append(full_url)
         except Exception as e:
@@ -83,10 +360,8 @@ class WebScraper:
 
     async def get_meta_data(self, client: httpx.AsyncClient, url: str) -> Dict[str, str]:
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            title = soup.title.string.strip() if soup.title else ""
+            soup, _ = await self._get_soup(client, url)
+            title = page_title(soup)
             meta = soup.find('meta', attrs={'name': 'description'})
             description = meta['content'].strip() if meta and 'content' in meta.attrs else ""
             return {'url': url, 'title': title, 'description': description}
@@ -96,23 +371,16 @@ class WebScraper:
 
     async def extract_main_text(self, client: httpx.AsyncClient, url: str) -> str:
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            texts = soup.find_all(string=True)
-            visible_texts = filter(is_visible, texts)
-            return " ".join(t.strip() for t in visible_texts if t.strip())
+            soup, _ = await self._get_soup(client, url)
+            return " ".join(iter_visible_text(soup))
         except Exception as e:
             print(f"[extract_main_text] Failed on {url}: {e}")
             return ""
 
     async def search_text_for_keywords(self, client: httpx.AsyncClient, url: str) -> List[str]:
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            text = soup.get_text(separator=' ').lower()
-            return [keyword for keyword in self.search_terms if keyword.lower() in text]
+            soup, _ = await self._get_soup(client, url)
+            return self._page_keywords(page_title(soup), " ".join(iter_visible_text(soup)))
         except Exception as e:
             print(f"[search_text_for_keywords] Failed on {url}: {e}")
             return []
@@ -120,14 +388,13 @@ class WebScraper:
     async def extract_links_with_text(self, client: httpx.AsyncClient, url: str) -> List[Dict[str, str]]:
         links = []
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup, base_url = await self._get_soup(client, url, parse_only=LINK_STRAINER)
             for a_tag in soup.find_all("a", href=True):
-                links.append({
-                    "text": a_tag.get_text(strip=True),
-                    "href": urljoin(url, a_tag["href"])
-                })
+                try:
+                    href = urljoin(base_url, a_tag["href"])
+                except ValueError:
+                    continue
+                links.append({"text": a_tag.get_text(strip=True), "href": href})
         except Exception as e:
             print(f"[extract_links_with_text] Failed on {url}: {e}")
         return links
@@ -135,14 +402,12 @@ class WebScraper:
     async def extract_json_ld(self, client: httpx.AsyncClient, url: str) -> List[Dict[str, Any]]:
         data = []
         try:
-            response = await client.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup, _ = await self._get_soup(client, url)
             scripts = soup.find_all("script", type="application/ld+json")
             for script in scripts:
                 try:
                     if script.string:
-                        parsed = json.loads(script.string)
+                        parsed = _json_loads(script.string.encode())
                         data.extend(parsed if isinstance(parsed, list) else [parsed])
                 except Exception as e:
                     print(f"[extract_json_ld] Error parsing JSON-LD on {url}: {e}")
@@ -150,81 +415,80 @@ class WebScraper:
             print(f"[extract_json_ld] Failed on {url}: {e}")
         return data
 
+    async def extract_tables(self, client: httpx.AsyncClient, url: str) -> List[List[List[str]]]:
+        tables = []
+        try:
+            soup, _ = await self._get_soup(client, url)
+            for table in soup.find_all("table"):
+                rows = []
+                for tr in table.find_all("tr"):
+                    cells = [cell.get_text(strip=True) for cell in tr.find_all(["th", "td"])]
+                    if cells:
+                        rows.append(cells)
+                tables.append(rows)
+        except Exception as e:
+            print(f"[extract_tables] Failed on {url}: {e}")
+        return tables
 
-    async def export_snapshots_to_json(self, filepath: str, snapshots: List[PageSnapshot]) -> None:
-        data = [snap.to_dict() for snap in snapshots]
-        async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-            await f.write(json.dumps(data, ensure_ascii=False, indent=2))
-
-    async def load_snapshots_from_json(self, path: str) -> List[PageSnapshot]:
-        async with aiofiles.open(path, "r", encoding="utf-8") as f:
-            raw = await f.read()
-            data = json.loads(raw)
-        return [PageSnapshot(**item) for item in data]
-
-    async def export_snapshots_to_csv(self, filepath: str, snapshots: List[PageSnapshot]) -> None:
-        rows = [
-            {
-                "url": snap.url,
-                "title": snap.title,
-                "main_text_snippet": snap.main_text_snippet[:300],
-                "num_links": len(snap.links),
-                "num_headings": sum(len(hs) for hs in snap.headings.values()),
-                "num_json_ld": len(snap.json_ld)
-            }
-            for snap in snapshots
-        ]
-        async with aiofiles.open(filepath, mode="w", newline="", encoding="utf-8") as f:
-            header = list(rows[0].keys()) if rows else []
-            await f.write(",".join(header) + "\n")
-            for row in rows:
-                line = ",".join(str(row[k]).replace("\n", " ").replace(",", " ") for k in header)
-                await f.write(line + "\n")
+    async def extract_all(self, client: httpx.AsyncClient, url: str) -> Dict[str, Any]:
+        """
+        Run every page extractor at once: metadata, headings, visible text, JSON-LD and links.
 
-    async def get_structured_snapshot(self, client: httpx.AsyncClient, url: str) -> PageSnapshot:
-        def is_visible(element):
-            if element.parent.name in ['style', 'script', 'head', 'meta', '[document]']:
-                return False
-            if isinstance(element, Comment):
-                return False
-            return True
+        Args:
+            client (httpx.AsyncClient): Client used to fetch the page.
+            url (str): Page URL.
 
+        Returns:
+            Dict[str, Any]: title, description, headings, main_text, json_ld and links for the page.
+        """
         try:
-            response = await client.get(url)
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            title = soup.title.string.strip() if soup.title else ""
-            headings = {
-                f"h{i}": [tag.get_text(strip=True) for tag in soup.find_all(f"h{i}")]
-                for i in range(1, 7)
+            soup, base_url = await self._get_soup(client, url)
+            return self._scan_soup(soup, url, base_url)
+        except Exception as e:
+            print(f"[extract_all] Failed on {url}: {e}")
+            return {
+                "url": url,
+                "title": "",
+                "description": "",
+                "headings": {f"h{i}": [] for i in range(1, 7)},
+                "main_text": "",
+                "json_ld": [],
+                "links": []
             }
-            texts = soup.find_all(string=True)
-            visible_texts = filter(is_visible, texts)
-            joined_text = " ".join(t.strip() for t in visible_texts if t.strip())
-            snippet = joined_text[:1000] + "..." if len(joined_text) > 1000 else joined_text
 
-            json_ld = []
-            for script in soup.find_all("script", type="application/ld+json"):
-                try:
-                    parsed = json.loads(script.string)
-                    json_ld.extend(parsed if isinstance(parsed, list) else [parsed])
-                except Exception:
-                    continue
+    async def export_snapshots_to_json(self, filepath: str, snapshots: List[PageSnapshot]) -> None:
+        blob = _json_dumps(snapshots)
+        await asyncio.to_thread(Path(filepath).write_bytes, blob)
 
-            links = [
-                {"text": a.get_text(strip=True), "href": urljoin(url, a["href"])}
-                for a in soup.find_all("a", href=True)
-            ]
+    async def load_snapshots_from_json(self, path: str) -> List[PageSnapshot]:
+        raw = await asyncio.to_thread(Path(path).read_bytes)
+        return [PageSnapshot(**item) for item in _json_loads(raw)]
 
-            return PageSnapshot(
-                url=url,
-                title=title,
-                headings=headings,
-                main_text_snippet=snippet,
-                json_ld=json_ld,
-                links=links
+    @staticmethod
+    def _write_snapshots_csv(filepath: str, snapshots: List[PageSnapshot]) -> None:
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(
+                (
+                    snap.url,
+                    snap.title,
+                    snap.main_text_snippet[:300],
+                    len(snap.links),
+                    sum(map(len, snap.headings.values())),
+                    len(snap.json_ld)
+                )
+                for snap in snapshots
             )
 
+    async def export_snapshots_to_csv(self, filepath: str, snapshots: List[PageSnapshot]) -> None:
+        await asyncio.to_thread(self._write_snapshots_csv, filepath, snapshots)
+
+    async def get_structured_snapshot(self, client: httpx.AsyncClient, url: str) -> PageSnapshot:
+        try:
+            soup, base_url = await self._get_soup(client, url)
+            return self._snapshot_from_page(self._scan_soup(soup, url, base_url))
+
         except Exception as e:
             print(f"Snapshot Failed for {url}: {e}")
             return PageSnapshot(
@@ -238,92 +502,241 @@ class WebScraper:
 
 
     def filter_links_by_file_type(self, links: List[str]) -> List[str]:
-       return [link for link in links if any(link.lower().endswith(ext) for ext in self.file_types)]
+        suffixes = self._file_type_suffixes
+        if not suffixes:
+            return []
+        # Only the tail can match, so avoid lowercasing whole (often long) URLs
+        tail = -self._file_type_suffix_len
+        return [link for link in links if link[tail:].lower().endswith(suffixes)]
+
+    def _download_target(self, url: str, parsed_url: ParseResult) -> Tuple[str, str]:
+        """
+        Return the folder and file path a URL downloads to.
 
-    def download_files(self, links: List[str]) -> List[str]:
-        downloaded = []
-        for url in links:
+        Each path belongs to the first URL that claims it, so concurrent downloads of
+        different URLs sharing a basename (/x/report.pdf, /y/report.pdf) never write to
+        one file; later URLs get a short hash of the URL added to the name.
+        """
+        domain = parsed_url.netloc.replace('.', '_')
+        ext = os.path.splitext(parsed_url.path)[-1].lstrip('.')
+        folder = os.path.join(self.output_dir, domain, ext)
+        filename = os.path.basename(parsed_url.path) or "index"
+        filepath = os.path.join(folder, filename)
+        if self._download_owners.setdefault(filepath, url) != url:
+            stem, suffix = os.path.splitext(filename)
+            digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+            filepath = os.path.join(folder, f"{stem}-{digest}{suffix}")
+            self._download_owners.setdefault(filepath, url)
+        return folder, filepath
+
+    @staticmethod
+    def _remove_partial_download(path: Optional[str]) -> None:
+        """Delete a file left truncated by a failed download."""
+        if path is not None:
             try:
-                response = httpx.get(url)
+                os.remove(path)
+            except OSError:
+                pass
+
+    async def _download_file_async(self, client: httpx.AsyncClient, limit: asyncio.Semaphore,
+                                   host_limits: Dict[str, asyncio.Semaphore], folders: Set[str],
+                                   url: str, parsed_url: ParseResult,
+                                   target: Tuple[str, str]) -> Optional[str]:
+        folder, filepath = target
+        partial_path = None
+        try:
+            # Host slot first, as in crawl, so files queued on a busy host don't pin global slots
+            async with host_limits[parsed_url.netloc], limit, client.stream("GET", url) as response:
                 response.raise_for_status()
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc.replace('.', '_')
-                ext = os.path.splitext(parsed_url.path)[-1].lstrip('.')
-                folder = os.path.join(self.output_dir, domain, ext)
-                os.makedirs(folder, exist_ok=True)
-                filename = os.path.basename(parsed_url.path) or "index"
-                filepath = os.path.join(folder, filename)
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                downloaded.append(filepath)
-            except Exception as e:
-                print(f"[download_files] Failed for {url}: {e}")
-        return downloaded
-    
-    
+                if folder not in folders:
+                    os.makedirs(folder, exist_ok=True)
+                    folders.add(folder)
+                partial_path = filepath
+                async with aiofiles.open(filepath, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+            return filepath
+        except Exception as e:
+            print(f"[download_files_async] Failed for {url}: {e}")
+            self._remove_partial_download(partial_path)
+            return None
+
+    async def download_files_async(
+        self,
+        links: List[str],
+        max_concurrency: int = 16,
+        per_host_limit: int = 4,
+        limit: Optional[asyncio.Semaphore] = None,
+        host_limits: Optional[Dict[str, asyncio.Semaphore]] = None
+    ) -> List[str]:
+        """
+        Download files concurrently over the shared async client, streaming each body to disk.
+
+        Args:
+            links (List[str]): File URLs to download.
+            max_concurrency (int): Maximum number of concurrent downloads.
+            per_host_limit (int): Maximum concurrent downloads from any single host.
+            limit (asyncio.Semaphore | None): Overall download semaphore to share across calls;
+                a fresh one of size max_concurrency is used when omitted.
+            host_limits (Dict[str, asyncio.Semaphore] | None): Per-host semaphores to share
+                across calls; missing hosts are added with per_host_limit slots.
+
+        Returns:
+            List[str]: Local paths of the files that were downloaded, in input order.
+        """
+        if not links:
+            return []
+        client = self._get_client()
+        if limit is None:
+            limit = asyncio.Semaphore(max_concurrency)
+        if host_limits is None:
+            host_limits = {}
+        links = list(dict.fromkeys(links))
+        parsed_urls = [urlparse(url) for url in links]
+        targets = [self._download_target(url, parsed) for url, parsed in zip(links, parsed_urls)]
+        for parsed in parsed_urls:
+            if parsed.netloc not in host_limits:
+                host_limits[parsed.netloc] = asyncio.Semaphore(per_host_limit)
+        folders: Set[str] = set()
+        results = await asyncio.gather(*(
+            self._download_file_async(client, limit, host_limits, folders, url, parsed, target)
+            for url, parsed, target in zip(links, parsed_urls, targets)
+        ))
+        return [path for path in results if path is not None]
+
+    def download_files(self, links: List[str], max_concurrency: int = 16, per_host_limit: int = 4) -> List[str]:
+        """
+        Blocking wrapper around download_files_async for callers without an event loop.
+
+        The pooled client is closed before returning, since its connections belong to the
+        loop this call runs.
+        """
+        async def run() -> List[str]:
+            try:
+                return await self.download_files_async(links, max_concurrency, per_host_limit)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
     async def crawl(
         self,
         start_urls: List[str] | None = None,
         max_depth: int | None = None,
-        concurrency: int = 10
+        concurrency: int = 32,
+        per_host_limit: int = 4,
+        download_concurrency: int = 16
     ):
         """
         Asynchronous breadth-first crawler that respects max_depth and avoids revisiting URLs.
         Also collects PageSnapshot objects and downloads matched files.
+        Requests go through the shared pooled client; close it with aclose() when done.
     
         Args:
             start_urls (List[str] | None): Seed URLs to begin crawling (defaults to self.urls).
             max_depth (int | None): Maximum depth to crawl (defaults to self.max_depth).
-            concurrency (int): Maximum concurrent requests.
+            concurrency (int): Maximum concurrent page fetches across all hosts.
+            per_host_limit (int): Maximum concurrent page fetches against any single host,
+                and separately the maximum concurrent downloads from it.
+            download_concurrency (int): Maximum concurrent file downloads across the whole crawl.
         """
         start_urls = start_urls or self.urls
         max_depth = max_depth if max_depth is not None else self.max_depth
         self.snapshots = []
         self.files_downloaded = []
-        visited = set()
-        queue = asyncio.Queue()
-    
-        for url in start_urls:
-            await queue.put((url, 0))
-    
-        async with httpx.AsyncClient(timeout=10) as client:
-            semaphore = asyncio.Semaphore(concurrency)
-    
-            async def worker():
-                while not queue.empty():
-                    url, depth = await queue.get()
-                    if url in visited or depth > max_depth:
-                        continue
-                    visited.add(url)
-    
-                    async with semaphore:
-                        try:
-                            print(f"[CRAWL] Depth {depth}: {url}")
-    
-                            # Keyword filtering
-                            keyword_matches = await self.search_text_for_keywords(client, url)
-                            if not keyword_matches:
-                                print(f"[SKIP] No keyword match for {url}")
-                                return
-    
-                            # Snapshot collection
-                            snapshot = await self.get_structured_snapshot(client, url)
-                            self.snapshots.append(snapshot)
-    
-                            # File discovery and download
-                            links = await self.fetch_links_from_url(client, url)
-                            file_links = self.filter_links_by_file_type(links)
-                            downloaded = self.download_files(file_links)
-                            self.files_downloaded.extend(downloaded)
-    
-                            # Queue additional links
-                            for link in links:
-                                if link not in visited:
-                                    await queue.put((link, depth + 1))
-    
-                        except Exception as e:
-                            print(f"[ERROR] {url}: {e}")
-    
-            workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
-            await asyncio.gather(*workers)
-    
+        visited: Set[str] = set()
+        requested_files: Set[str] = set()
+        client = self._get_client()
+        semaphore = asyncio.Semaphore(concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        # Shared by every page's downloads so the caps hold for the crawl, not per page
+        download_limit = asyncio.Semaphore(download_concurrency)
+        download_host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async with asyncio.TaskGroup() as tg:
+
+            def schedule(url: str, depth: int) -> None:
+                try:
+                    url = self._canonicalize(url)
+                except ValueError as e:
+                    print(f"[SKIP] Malformed URL {url!r}: {e}")
+                    return
+                if url in visited or depth > max_depth:
+                    return
+                if self._recently_failed(url):
+                    print(f"[SKIP] Failed within the last {FAILED_URL_TTL // 60} minutes: {url}")
+                    return
+                visited.add(url)
+                tg.create_task(process(url, depth))
+
+            async def process(url: str, depth: int) -> None:
+                host = urlsplit(url).netloc
+                host_limit = host_limits.get(host)
+                if host_limit is None:
+                    host_limit = host_limits[host] = asyncio.Semaphore(per_host_limit)
+                # Take the host slot first so a busy host doesn't pin global slots while it waits
+                async with host_limit, semaphore:
+                    try:
+                        print(f"[CRAWL] Depth {depth}: {url}")
+
+                        soup, base_url = await self._get_soup(client, url)
+                        keyword_matches, snapshot, links = self._analyze(soup, url, base_url)
+
+                        # Keyword filtering
+                        if not keyword_matches:
+                            print(f"[SKIP] No keyword match for {url}")
+                            return
+
+                        # Snapshot collection
+                        self.snapshots.append(snapshot)
+
+                        # File discovery
+                        # Pages often share files; fetch each one once per crawl
+                        file_links = [
+                            link for link in dict.fromkeys(self.filter_links_by_file_type(links))
+                            if link not in requested_files
+                        ]
+                        requested_files.update(file_links)
+
+                    except httpx.HTTPError as e:
+                        # Only fetch failures are worth not re-requesting for a while
+                        print(f"[ERROR] {url}: {e}")
+                        self._failed[url] = time.monotonic()
+                        return
+                    except Exception as e:
+                        print(f"[ERROR] {url}: {e}")
+                        return
+                    finally:
+                        # visited guarantees the page is never needed again
+                        self._soup_cache.pop(url, None)
+
+                # Downloads run under their own caps, outside this page's fetch slots
+                if file_links:
+                    tg.create_task(download(url, file_links))
+
+                if depth >= max_depth:
+                    return
+                # Queue additional links; they wait on the semaphore, not on this page.
+                # visited is filled at scheduling time, so one set difference drops both
+                # crawled and already queued URLs
+                frontier = set(map(self._canonicalize, links))
+                frontier -= visited
+                visited.update(frontier)
+                for link in frontier:
+                    if not self._recently_failed(link):
+                        tg.create_task(process(link, depth + 1))
+
+            async def download(url: str, file_links: List[str]) -> None:
+                try:
+                    downloaded = await self.download_files_async(
+                        file_links,
+                        per_host_limit=per_host_limit,
+                        limit=download_limit,
+                        host_limits=download_host_limits
+                    )
+                    self.files_downloaded.extend(downloaded)
+                except Exception as e:
+                    print(f"[ERROR] Downloading files from {url}: {e}")
+
+            for url in start_urls:
+                schedule(url, 0)
@@ -2,6 +2,7 @@
 
 
 from typing import Callable, Any, List, Dict 
+import asyncio
 import inspect 
 import logging 
 
@@ -25,6 +26,9 @@ class ToolExecutor:
 
         """
         self.tools = {fn.__name__: fn for fn in tools}
+        # Signatures are resolved once here; inspect.signature is too slow to call per execution
+        self._signatures = {name: inspect.signature(fn) for name, fn in self.tools.items()}
+        self._params = {name: frozenset(sig.parameters) for name, sig in self._signatures.items()}
 
 
     def has_tool(self, name: str) -> bool:
@@ -33,6 +37,7 @@ class ToolExecutor:
 
     def list_tools(self) -> List[str]:
         """Return a list of all available tool names"""
+        return list(self.tools)
 
     def get_signature(self,name: str)-> Dict[str,inspect.Parameter]:
         """
@@ -47,7 +52,7 @@ class ToolExecutor:
 
         if name not in self.tools:
             raise ValueError(f"Tool '{name}' is not registered")
-        return inspect.signature(self.tools[name]).parameters 
+        return self._signatures[name].parameters
 
     def execute(self, name: str, args: Dict[str, Any]) -> Any:
         """
@@ -65,16 +70,49 @@ class ToolExecutor:
             raise ValueError(f"Tool '{name}' is not available")
 
         fn = self.tools[name]
-        sig = inspect.signature(fn)
+        params = self._params[name]
 
         accepted_args =  {
-                k: v for k, v in args.items() if k in sig.parameters
+                k: v for k, v in args.items() if k in params
         }
 
         try:
             logger.info(f"Executing tool: {name} with args: {accepted_args}")
+            if inspect.iscoroutinefunction(fn):
+                return asyncio.run(fn(**accepted_args))
             return fn(**accepted_args)
 
         except Exception as e:
             logger.exception(f"Error during execution of tool '{name}': {e}")
             raise
+
+    async def aexecute(self, name: str, args: Dict[str, Any]) -> Any:
+        """
+        Async counterpart of execute: awaits coroutine tools directly and runs
+        blocking tools in a worker thread so the event loop stays free.
+
+        Args: 
+            name(str): Name of the registered tool function. 
+            args(Dict[str,Any]): Keyword arguments for the tool. 
+
+        Returns: 
+            Any: Result of the tool execution.
+        """
+
+        if name not in self.tools:
+            raise ValueError(f"Tool '{name}' is not available")
+
+        fn = self.tools[name]
+        if not inspect.iscoroutinefunction(fn):
+            return await asyncio.to_thread(self.execute, name, args)
+
+        params = self._params[name]
+        accepted_args = {k: v for k, v in args.items() if k in params}
+
+        try:
+            logger.info(f"Executing tool: {name} with args: {accepted_args}")
+            return await fn(**accepted_args)
+
+        except Exception as e:
+            logger.exception(f"Error during execution of tool '{name}': {e}")
+            raise
@@ -1,5 +1,6 @@
 # tools.py
 
+import asyncio
 from typing import List, Dict, Any
 from pathlib import Path
 from python_llm_toolkit.scraper import WebScraper, SEARCH_TERMS, FILE_EXTENSIONS
@@ -7,7 +8,7 @@ from python_llm_toolkit.scraper import WebScraper, SEARCH_TERMS, FILE_EXTENSIONS
 DEFAULT_OUTPUT_DIR = str(Path("downloads").resolve())
 
 
-def get_page_metadata(urls: List[str]) -> List[Dict[str, str]]:
+async def get_page_metadata(urls: List[str]) -> List[Dict[str, str]]:
     """
     Extract metadata (title and description) from a list of web pages.
 
@@ -24,10 +25,12 @@ def get_page_metadata(urls: List[str]) -> List[Dict[str, str]]:
         search_terms=SEARCH_TERMS,
         max_depth=5
     )
-    return scraper.get_meta_data()
+    async with scraper:
+        client = scraper.client
+        return list(await asyncio.gather(*(scraper.get_meta_data(client, url) for url in urls)))
 
 
-def download_files_by_type(urls: List[str], file_extensions: List[str]) -> List[str]:
+async def download_files_by_type(urls: List[str], file_extensions: List[str]) -> List[str]:
     """
     Download files matching the given file extensions from the specified URLs.
 
@@ -46,12 +49,15 @@ def download_files_by_type(urls: List[str], file_extensions: List[str]) -> List[
         max_depth=5
     )
 
-    links = scraper.fetch_links_from_url()
-    filtered = scraper.filter_links_by_file_type(links)
-    return scraper.download_files(filtered)
+    async with scraper:
+        client = scraper.client
+        pages = await asyncio.gather(*(scraper.fetch_links_from_url(client, url) for url in urls))
+        links = list(dict.fromkeys(link for page_links in pages for link in page_links))
+        filtered = scraper.filter_links_by_file_type(links)
+        return await scraper.download_files_async(filtered)
 
 
-def get_structured_snapshots(urls: List[str]) -> List[Dict[str, Any]]:
+async def get_structured_snapshots(urls: List[str]) -> List[Dict[str, Any]]:
     """
     Retrieve a structured snapshot (title, headings, links, etc.) from each web page.
 
@@ -69,11 +75,13 @@ def get_structured_snapshots(urls: List[str]) -> List[Dict[str, Any]]:
         max_depth=5
     )
 
-    snapshots = scraper.get_structured_page_snapshot()
+    async with scraper:
+        client = scraper.client
+        snapshots = await asyncio.gather(*(scraper.get_structured_snapshot(client, url) for url in urls))
     return [snap.to_dict() for snap in snapshots]
 
 
-def search_keywords_in_page(urls: List[str], keywords: List[str]) -> Dict[str, List[str]]:
+async def search_keywords_in_page(urls: List[str], keywords: List[str]) -> Dict[str, List[str]]:
     """
     Search for specific keywords on each page.
 
@@ -92,10 +100,13 @@ def search_keywords_in_page(urls: List[str], keywords: List[str]) -> Dict[str, L
         max_depth=5
     )
 
-    return scraper.search_text_for_keywords()
+    async with scraper:
+        client = scraper.client
+        matches = await asyncio.gather(*(scraper.search_text_for_keywords(client, url) for url in urls))
+    return dict(zip(urls, matches))
 
 
-def extract_tables_from_page(urls: List[str]) -> Dict[str, List[List[List[str]]]]:
+async def extract_tables_from_page(urls: List[str]) -> Dict[str, List[List[List[str]]]]:
     """
     Extract HTML tables from each URL.
 
@@ -113,7 +124,10 @@ def extract_tables_from_page(urls: List[str]) -> Dict[str, List[List[List[str]]]
         max_depth=5
     )
 
-    return scraper.extract_tables()
+    async with scraper:
+        client = scraper.client
+        tables = await asyncio.gather(*(scraper.extract_tables(client, url) for url in urls))
+    return dict(zip(urls, tables))
 
 
 SCRAPING_TOOLS = [
@@ -0,0 +1,125 @@
+# test_chatbot.py
+
+import sys
+import asyncio
+from pathlib import Path
+import pytest
+
+pytest.importorskip("ollama")
+from ollama import ChatResponse, Message
+import python_llm_toolkit
+
+# chatbot.py imports its siblings as top-level modules
+sys.path.insert(0, str(Path(python_llm_toolkit.__file__).parent))
+from python_llm_toolkit.chatbot import ChatBot
+
+
+class ToolProbe:
+    """Records how many tool calls run at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def lookup(self, key: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return key.upper()
+
+
+class StubClient:
+    """Stands in for ollama.AsyncClient: replies "reply N" and asks for two tool calls on tool_turns."""
+
+    def __init__(self, tool_turns=(), fail_summary=False):
+        self.tool_turns = set(tool_turns)
+        self.fail_summary = fail_summary
+        self.turn = 0
+        self.summaries = 0
+
+    async def chat(self, model, messages, tools=None):
+        if tools is None:
+            if self.fail_summary:
+                raise RuntimeError("summarizer down")
+            self.summaries += 1
+            return ChatResponse(message=Message(role="assistant", content=f"summary {self.summaries}"))
+        if messages[-1]["role"] == "user":
+            self.turn += 1
+            if self.turn in self.tool_turns:
+                calls = [
+                    Message.ToolCall(function=Message.ToolCall.Function(name="lookup", arguments={"key": key}))
+                    for key in ("a", "b")
+                ]
+                return ChatResponse(message=Message(role="assistant", content="", tool_calls=calls))
+        return ChatResponse(message=Message(role="assistant", content=f"reply {self.turn}"))
+
+
+def make_bot(client, probe, **kwargs):
+    bot = ChatBot(model="test", tools=[probe.lookup], max_turns=4, **kwargs)
+    bot._client = client
+    bot.messages.append({"role": "system", "content": "be brief"})
+    return bot
+
+
+def roles(bot):
+    return [m["role"] for m in bot.messages]
+
+
+@pytest.mark.asyncio
+async def test_send_runs_tool_calls_concurrently():
+    probe = ToolProbe()
+    bot = make_bot(StubClient(tool_turns={1}), probe)
+    assert await bot.send("look up a and b") == "reply 1"
+    assert probe.peak == 2
+    assert roles(bot) == ["system", "user", "assistant", "tool", "tool", "assistant"]
+    assert [m["content"] for m in bot.messages[3:5]] == ['"A"', '"B"']
+
+
+@pytest.mark.asyncio
+async def test_trim_history_cuts_on_user_turn_and_pins_system():
+    bot = make_bot(StubClient(tool_turns={4}), ToolProbe())
+    for i in range(4):
+        await bot.send(f"q{i + 1}")
+    assert roles(bot).count("user") == 4
+
+    await bot.send("q5")
+    # Back to half of max_turns; turn 4's tool results stay with its calls
+    assert roles(bot) == ["system", "user", "assistant", "tool", "tool", "assistant", "user", "assistant"]
+    assert bot.messages[0]["content"] == "be brief"
+    assert bot.messages[1]["content"] == "q4"
+
+
+@pytest.mark.asyncio
+async def test_trim_history_replaces_previous_summary():
+    client = StubClient()
+    bot = make_bot(client, ToolProbe(), summarize=True)
+    for i in range(5):
+        await bot.send(f"q{i + 1}")
+    assert roles(bot) == ["system", "system", "user", "assistant", "user", "assistant"]
+    assert bot.messages[1]["content"] == "Earlier conversation: summary 1"
+
+    for i in range(5, 8):
+        await bot.send(f"q{i + 1}")
+    assert client.summaries == 2
+    assert roles(bot) == ["system", "system", "user", "assistant", "user", "assistant"]
+    assert [m["content"] for m in bot.messages[:3]] == ["be brief", "Earlier conversation: summary 2", "q7"]
+
+
+@pytest.mark.asyncio
+async def test_trim_history_without_system_does_not_pin_summary():
+    bot = ChatBot(model="test", tools=[], max_turns=4, summarize=True)
+    bot._client = StubClient()
+    for i in range(8):
+        await bot.send(f"q{i + 1}")
+    assert roles(bot) == ["system", "user", "assistant", "user", "assistant"]
+    assert bot.messages[0]["content"] == "Earlier conversation: summary 2"
+
+
+@pytest.mark.asyncio
+async def test_trim_history_survives_summarizer_failure():
+    bot = make_bot(StubClient(fail_summary=True), ToolProbe(), summarize=True)
+    for i in range(5):
+        await bot.send(f"q{i + 1}")
+    assert roles(bot) == ["system", "user", "assistant", "user", "assistant"]
+    assert bot.messages[1]["content"] == "q4"
@@ -0,0 +1,56 @@
+# test_tool_executor.py
+
+import asyncio
+import pytest
+from python_llm_toolkit.tool_executor import ToolExecutor
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def greet(name: str, output_dir: str = "downloads") -> str:
+    return f"{name}:{output_dir}"
+
+
+async def async_add(a: int, b: int) -> int:
+    await asyncio.sleep(0)
+    return a + b
+
+
+def test_list_tools():
+    executor = ToolExecutor([add, greet])
+    assert executor.list_tools() == ["add", "greet"]
+
+
+def test_get_signature():
+    executor = ToolExecutor([add, greet])
+    assert list(executor.get_signature("greet")) == ["name", "output_dir"]
+    with pytest.raises(ValueError):
+        executor.get_signature("missing")
+
+
+def test_execute_drops_unknown_args():
+    executor = ToolExecutor([add])
+    assert executor.execute("add", {"a": 2, "b": 3, "extra": 1}) == 5
+    with pytest.raises(ValueError):
+        executor.execute("missing", {})
+
+
+def test_execute_runs_coroutine_tool():
+    executor = ToolExecutor([async_add])
+    assert executor.execute("async_add", {"a": 2, "b": 3, "extra": 1}) == 5
+
+
+@pytest.mark.asyncio
+async def test_aexecute_awaits_async_tool():
+    executor = ToolExecutor([async_add])
+    assert await executor.aexecute("async_add", {"a": 2, "b": 3, "extra": 1}) == 5
+
+
+@pytest.mark.asyncio
+async def test_aexecute_runs_sync_tool():
+    executor = ToolExecutor([greet])
+    assert await executor.aexecute("greet", {"name": "a", "output_dir": "out"}) == "a:out"
+    with pytest.raises(ValueError):
+        await executor.aexecute("missing", {})
@@ -0,0 +1,89 @@
+# test_tools.py
+
+import os
+import httpx
+import pytest
+from python_llm_toolkit import tools
+from python_llm_toolkit.scraper import WebScraper
+
+PAGES = {
+    "/prices": (
+        "<html><head><title>Price list</title><meta name='description' content='Charges'></head>"
+        "<body><p>Cost estimates</p><table><tr><th>MRI</th><td>$1,200</td></tr></table>"
+        "<a href='/files/charges.pdf'>charges</a><a href='/files/list.csv'>list</a></body></html>"
+    ),
+    "/about": "<p>About us</p><a href='/files/charges.pdf'>charges again</a><a href='/files/brochure.PDF'>brochure</a>",
+}
+
+
+@pytest.fixture
+def requested(monkeypatch, tmp_path):
+    """Route every scraper client through a MockTransport serving PAGES and small files."""
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path.startswith("/files/"):
+            return httpx.Response(200, content=b"data")
+        if request.url.path in PAGES:
+            return httpx.Response(200, html=PAGES[request.url.path])
+        return httpx.Response(404)
+
+    def get_client(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+        return self._client
+
+    monkeypatch.setattr(WebScraper, "_get_client", get_client)
+    monkeypatch.setattr(tools, "DEFAULT_OUTPUT_DIR", str(tmp_path))
+    return paths
+
+
+@pytest.mark.asyncio
+async def test_search_keywords_in_page(requested):
+    urls = ["https://example.com/prices", "https://example.com/about", "https://example.com/missing"]
+    assert await tools.search_keywords_in_page(urls, ["Price", "estimates", "about"]) == {
+        "https://example.com/prices": ["Price", "estimates"],
+        "https://example.com/about": ["about"],
+        "https://example.com/missing": [],
+    }
+
+
+@pytest.mark.asyncio
+async def test_download_files_by_type(requested, tmp_path):
+    urls = ["https://example.com/prices", "https://example.com/about"]
+    downloaded = await tools.download_files_by_type(urls, [".pdf"])
+    folder = os.path.join(str(tmp_path), "example_com")
+    assert sorted(downloaded) == [
+        os.path.join(folder, "PDF", "brochure.PDF"),
+        os.path.join(folder, "pdf", "charges.pdf"),
+    ]
+    assert all(os.path.isfile(path) for path in downloaded)
+    # charges.pdf is linked from both pages but fetched once; the csv is filtered out
+    assert sorted(path for path in requested if path.startswith("/files/")) == [
+        "/files/brochure.PDF", "/files/charges.pdf"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_page_metadata(requested):
+    assert await tools.get_page_metadata(["https://example.com/prices"]) == [
+        {"url": "https://example.com/prices", "title": "Price list", "description": "Charges"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_structured_snapshots(requested):
+    snapshots = await tools.get_structured_snapshots(["https://example.com/about"])
+    assert snapshots[0]["url"] == "https://example.com/about"
+    assert snapshots[0]["links"] == [
+        {"text": "charges again", "href": "https://example.com/files/charges.pdf"},
+        {"text": "brochure", "href": "https://example.com/files/brochure.PDF"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_extract_tables_from_page(requested):
+    assert await tools.extract_tables_from_page(["https://example.com/prices"]) == {
+        "https://example.com/prices": [[["MRI", "$1,200"]]]
+    }